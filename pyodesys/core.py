@@ -152,7 +152,8 @@ class ODESys(object):
 
     Notes
     -----
-    Banded jacobians are supported by "scipy" and "cvode" integrators.
+    Banded jacobians are supported by "scipy" and "cvode" integrators (and
+    by the implicit integrators in :mod:`pyodesys.integrators`).
 
     """
 
@@ -430,6 +431,10 @@ class ODESys(object):
             nfo = getattr(self, '_integrate_' + integrator)(*args, **kwargs)
         else:
             kwargs['with_jacobian'] = getattr(integrator, 'with_jacobian', None)
+            if kwargs['with_jacobian'] and self.band is not None:
+                if 'lband' in kwargs or 'uband' in kwargs:
+                    raise ValueError("lband and uband set locally (set `band` at initialization instead)")
+                kwargs['lband'], kwargs['uband'] = self.band
             nfo = self._integrate(integrator.integrate_adaptive,
                                   integrator.integrate_predefined,
                                   *args, **kwargs)
@@ -579,9 +584,9 @@ class ODESys(object):
             def _f(x, y, fout):
                 try:
                     if len(_p) > 0:
-                        fout[:] = np.asarray(self.f_cb(x, y, _p))
+                        fout[:] = self.f_cb(x, y, _p)
                     else:
-                        fout[:] = np.asarray(self.f_cb(x, y))
+                        fout[:] = self.f_cb(x, y)
                 except RecoverableError:
                     return 1  # recoverable error
 
@@ -602,15 +607,14 @@ class ODESys(object):
                     new_kwargs['nnz'] = self.nnz
                 else:
                     def _j(x, y, jout, dfdx_out=None, fy=None):
-                        if len(_p) > 0:
-                            jout[:, :] = np.asarray(self.j_cb(x, y, _p))
-                        else:
-                            jout[:, :] = np.asarray(self.j_cb(x, y))
                         if dfdx_out is not None:
-                            if len(_p) > 0:
-                                dfdx_out[:] = np.asarray(self.dfdx_cb(x, y, _p))
-                            else:
-                                dfdx_out[:] = np.asarray(self.dfdx_cb(x, y))
+                            J, dfdx = self._jac_and_dfdx(x, y, _p)
+                            jout[:, :] = J
+                            dfdx_out[:] = np.asarray(dfdx)  # conventionally of shape (1, ny)
+                        elif len(_p) > 0:
+                            jout[:, :] = self.j_cb(x, y, _p)
+                        else:
+                            jout[:, :] = self.j_cb(x, y)
             else:
                 _j = None
 
@@ -619,9 +623,9 @@ class ODESys(object):
                 def _jtimes(v, Jv, x, y, fy=None):
                     yv = np.concatenate((y, v))
                     if len(_p) > 0:
-                        Jv[:] = np.asarray(self.jtimes_cb(x, yv, _p))
+                        Jv[:] = self.jtimes_cb(x, yv, _p)
                     else:
-                        Jv[:] = np.asarray(self.jtimes_cb(x, yv))
+                        Jv[:] = self.jtimes_cb(x, yv)
                 new_kwargs['jtimes'] = _jtimes
 
             if self.first_step_cb is not None:
@@ -638,9 +642,9 @@ class ODESys(object):
             if self.roots_cb is not None:
                 def _roots(x, y, out):
                     if len(_p) > 0:
-                        out[:] = np.asarray(self.roots_cb(x, y, _p))
+                        out[:] = self.roots_cb(x, y, _p)
                     else:
-                        out[:] = np.asarray(self.roots_cb(x, y))
+                        out[:] = self.roots_cb(x, y)
                 if 'roots' in new_kwargs:
                     raise ValueError("cannot override roots")
                 else:
@@ -766,6 +770,29 @@ class ODESys(object):
         J = self.j_cb(xval, yvals, intern_p)
         return svd(J, compute_uv=False)
 
+    def _jac_and_dfdx(self, x, y, p=()):
+        """ Evaluates the jacobian and its derivative with respect to x at (x, y). """
+        args = (x, y, p) if len(p) > 0 else (x, y)
+        return self.j_cb(*args), self.dfdx_cb(*args)
+
+    def _jac_singular_values(self, x, y, intern_p):
+        """ Singular values of the jacobian at each point in (x, y). """
+        return np.array([self._jac_eigenvals_svd(xval, yvals, intern_p) for xval, yvals in zip(x, y)])
+
+    def _eigenvals_at(self, eigenvals_cb, x, y, intern_p):
+        """ Evaluates ``eigenvals_cb`` at each point in (x, y). """
+        return np.array([eigenvals_cb(xval, yvals, intern_p) for xval, yvals in zip(x, y)])
+
+    def _stiffness_ratio(self, x, y, intern_p, eigenvals_cb=None):
+        if eigenvals_cb is None:
+            if self.band is not None:
+                raise NotImplementedError
+            singular_values = self._jac_singular_values(x, y, intern_p)
+        else:
+            singular_values = self._eigenvals_at(eigenvals_cb, x, y, intern_p)
+        abs_sv = np.abs(singular_values)
+        return abs_sv.max(axis=-1) / abs_sv.min(axis=-1)
+
     def stiffness(self, xyp=None, eigenvals_cb=None):
         """ [DEPRECATED] Use :meth:`Result.stiffness`, stiffness ration
 
@@ -787,22 +814,12 @@ class ODESys(object):
             internal routine will use ``self.j_cb`` and ``scipy.linalg.svd``.
 
         """
-        if eigenvals_cb is None:
-            if self.band is not None:
-                raise NotImplementedError
-            eigenvals_cb = self._jac_eigenvals_svd
-
         if xyp is None:
             x, y, intern_p = self._internal
         else:
             x, y, intern_p = self.pre_process(*xyp)
 
-        singular_values = []
-        for xval, yvals in zip(x, y):
-            singular_values.append(eigenvals_cb(xval, yvals, intern_p))
-
-        return (np.abs(singular_values).max(axis=-1) /
-                np.abs(singular_values).min(axis=-1))
+        return self._stiffness_ratio(x, y, intern_p, eigenvals_cb)
 
 
 class OdeSys(ODESys):
@@ -3,6 +3,12 @@
 This module is for demonstration purposes only and the integrators here
 are not meant for production use. Consider them provisional, i.e., API here
 may break without prior deprecation.
+
+The explicit integrators (RK4, EulerForward & Midpoint) may also be called
+directly with ``y0`` of shape ``(B, ny)`` in order to integrate an ensemble
+of ``B`` initial conditions concurrently. ``rhs(x, y, out)`` then needs to
+accept ``y`` and ``out`` of that shape (e.g. by operating on ``y[..., i]``)
+and ``yout`` will have the shape ``(len(xout), B, ny)``.
 """
 
 import math
@@ -11,7 +17,82 @@ import warnings
 import numpy as np
 from .util import import_
 
-lu_factor, lu_solve = import_('scipy.linalg', 'lu_factor', 'lu_solve')
+dgetrf, dgetrs, dgbtrf, dgbtrs = import_('scipy.linalg.lapack', 'dgetrf', 'dgetrs', 'dgbtrf', 'dgbtrs')
+csc_matrix, sparse_identity = import_('scipy.sparse', 'csc_matrix', 'identity')
+splu = import_('scipy.sparse.linalg', 'splu')
+
+try:
+    from numba import njit
+except ImportError:
+    _rk4_combine_jit = _newton_residual_jit = _newton_update_jit = None
+else:
+    @njit(fastmath=True, cache=True)
+    def _rk4_combine_jit(y, h, k0, k1, k2, k3, out):
+        c = h/6.0
+        for i in range(y.shape[0]):
+            out[i] = y[i] + c*(k0[i] + 2.0*(k1[i] + k2[i]) + k3[i])
+
+    @njit(fastmath=True, cache=True)
+    def _newton_residual_jit(ynew, y, f, h, out):
+        for i in range(y.shape[0]):
+            out[i] = ynew[i] - y[i] - h*f[i]
+
+    @njit(fastmath=True, cache=True)
+    def _newton_update_jit(ynew, delta):
+        sq = 0.0
+        for i in range(ynew.shape[0]):
+            ynew[i] += delta[i]
+            sq += delta[i]*delta[i]
+        return math.sqrt(sq)
+
+
+def _rk4_combine(y, h, k, tmp, out):
+    """ Computes ``y + h/6*(k0 + 2*k1 + 2*k2 + k3)`` into ``out`` (``tmp`` is scratch). """
+    if _rk4_combine_jit is not None and y.ndim == 1:
+        _rk4_combine_jit(y, h, k[0], k[1], k[2], k[3], out)
+    else:
+        np.add(k[1], k[2], out=tmp)
+        tmp *= 2
+        tmp += k[0]
+        tmp += k[3]
+        tmp *= h/6
+        np.add(y, tmp, out=out)
+
+
+def _newton_residual(ynew, y, f, h, out):
+    """ Computes ``ynew - y - h*f`` into ``out``. """
+    if _newton_residual_jit is not None:
+        _newton_residual_jit(ynew, y, f, h, out)
+    else:
+        np.multiply(f, h, out=out)
+        np.subtract(ynew, out, out=out)
+        out -= y
+
+
+def _newton_update(ynew, delta):
+    """ Adds ``delta`` to ``ynew`` (in place) and returns the 2-norm of ``delta``. """
+    if _newton_update_jit is not None:
+        return _newton_update_jit(ynew, delta)
+    ynew += delta
+    return np.linalg.norm(delta)
+
+
+def _rk4_step(rhs, x, y, h, k, ytmp, out):
+    """ Takes one RK4 step from (x, y), the result is written to ``out``.
+
+    ``k`` (4 arrays) and ``ytmp`` are scratch buffers of the same shape as ``y``.
+    """
+    rhs(x, y, k[0])
+    np.multiply(h/2, k[0], out=ytmp)
+    ytmp += y
+    rhs(x + h/2, ytmp, k[1])
+    np.multiply(h/2, k[1], out=ytmp)
+    ytmp += y
+    rhs(x + h/2, ytmp, k[2])
+    np.multiply(h, k[2], out=ytmp)
+    ytmp += y
+    rhs(x + h, ytmp, k[3])
+    _rk4_combine(y, h, k, ytmp, out)
 
 
 class RK4_example_integrator:
@@ -28,37 +109,34 @@ class RK4_example_integrator:
             warnings.warn("Ignoring keyword-argumtents: %s" % ', '.join(kwargs.keys()))
         xspan = xend - x0
         n = int(math.ceil(xspan/dx0))
-        yout = [y0[:]]
-        xout = [x0]
-        k = [np.empty(len(y0)) for _ in range(4)]
+        shape = np.shape(y0)
+        yout = np.empty((n+2,) + shape)
+        xout = np.empty(n+2)
+        yout[0, :] = y0
+        xout[0] = x0
+        k = [np.empty(shape) for _ in range(4)]
+        ytmp = np.empty(shape)
         for i in range(0, n+1):
-            x, y = xout[-1], yout[-1]
+            x = xout[i]
             h = min(dx0, xend-x)
-            rhs(x,       y,            k[0])
-            rhs(x + h/2, y + h/2*k[0], k[1])
-            rhs(x + h/2, y + h/2*k[1], k[2])
-            rhs(x + h,   y + h*k[2],   k[3])
-            yout.append(y + h/6 * (k[0] + 2*k[1] + 2*k[2] + k[3]))
-            xout.append(x+h)
-        return np.array(xout), np.array(yout), {'nfev': n*4}
+            _rk4_step(rhs, x, yout[i, :], h, k, ytmp, yout[i+1, :])
+            xout[i+1] = x+h
+        return xout, yout, {'nfev': n*4}
 
     @staticmethod
     def integrate_predefined(rhs, jac, y0, xout, **kwargs):
         if kwargs:
             warnings.warn("Ignoring keyword-argumtents: %s" % ', '.join(kwargs.keys()))
         x_old = xout[0]
-        yout = [y0[:]]
-        k = [np.empty(len(y0)) for _ in range(4)]
+        shape = np.shape(y0)
+        yout = np.empty((len(xout),) + shape)
+        yout[0, :] = y0
+        k = [np.empty(shape) for _ in range(4)]
+        ytmp = np.empty(shape)
         for i, x in enumerate(xout[1:], 1):
-            y = yout[-1]
-            h = x - x_old
-            rhs(x_old,       y,            k[0])
-            rhs(x_old + h/2, y + h/2*k[0], k[1])
-            rhs(x_old + h/2, y + h/2*k[1], k[2])
-            rhs(x_old + h,   y + h*k[2],   k[3])
-            yout.append(y + h/6 * (k[0] + 2*k[1] + 2*k[2] + k[3]))
+            _rk4_step(rhs, x_old, yout[i-1, :], x - x_old, k, ytmp, yout[i, :])
             x_old = x
-        return np.array(yout), {'nfev': (len(xout)-1)*4}
+        return yout, {'nfev': (len(xout)-1)*4}
 
 
 class EulerForward_example_integrator:
@@ -71,15 +149,19 @@ class EulerForward_example_integrator:
         if kwargs:
             warnings.warn("Ignoring keyword-argumtents: %s" % ', '.join(kwargs.keys()))
         x_old = xout[0]
-        yout = [y0[:]]
-        f = np.empty(len(y0))
+        shape = np.shape(y0)
+        yout = np.empty((len(xout),) + shape)
+        yout[0, :] = y0
+        f = np.empty(shape)
+        tmp = np.empty(shape)
         for i, x in enumerate(xout[1:], 1):
-            y = yout[-1]
+            y = yout[i-1, :]
             h = x - x_old
             rhs(x_old, y, f)
-            yout.append(y + h*f)
+            np.multiply(h, f, out=tmp)
+            np.add(y, tmp, out=yout[i, :])
             x_old = x
-        return np.array(yout), {'nfev': (len(xout)-1)}
+        return yout, {'nfev': (len(xout)-1)}
 
 
 class Midpoint_example_integrator:
@@ -92,17 +174,122 @@ class Midpoint_example_integrator:
         if kwargs:
             warnings.warn("Ignoring keyword-argumtents: %s" % ', '.join(kwargs.keys()))
         x_old = xout[0]
-        yout = [y0[:]]
-        f = np.empty(len(y0))
+        shape = np.shape(y0)
+        yout = np.empty((len(xout),) + shape)
+        yout[0, :] = y0
+        f = np.empty(shape)
+        tmp = np.empty(shape)
         for i, x in enumerate(xout[1:], 1):
-            y = yout[-1]
+            y = yout[i-1, :]
             h = x - x_old
             rhs(x_old, y, f)
-            dy_efw = h*f
-            rhs(x_old + h/2, y + dy_efw/2, f)
-            yout.append(y + h*f)
+            np.multiply(h/2, f, out=tmp)
+            tmp += y
+            rhs(x_old + h/2, tmp, f)
+            np.multiply(h, f, out=tmp)
+            np.add(y, tmp, out=yout[i, :])
             x_old = x
-        return np.array(yout), {'nfev': (len(xout)-1)}
+        return yout, {'nfev': (len(xout)-1)}
+
+
+class _ImplicitEulerNewton(object):
+    """ Modified Newton iteration for ``ynew - y - h*f(x, ynew) = 0``.
+
+    The LU factorization of ``h*J - I`` is reused across steps (cf. the
+    "stale Jacobian" heuristics of e.g. CVode) and only recomputed when:
+
+    - the step size changed by more than ``dh_rtol`` (relative),
+    - the previous solve needed more than ``max_iter_reuse`` iterations,
+    - the iteration contracts slowly (ratio of consecutive correction
+      norms above ``max_contraction``) using a factorization from an
+      earlier step.
+
+    The jacobian callback is expected to follow the conventions of
+    :meth:`pyodesys.ODESys._integrate`: when ``band`` is given it fills
+    LAPACK banded storage of shape ``(ml+mu+1, ny)``, when ``nnz >= 0`` it
+    fills compressed sparse column data (``data, colptrs, rowvals``),
+    otherwise a dense ``(ny, ny)`` matrix.
+    """
+
+    def __init__(self, rhs, jac, ny, band=None, nnz=-1, tol=1e-12, dh_rtol=0.2,
+                 max_iter_reuse=3, max_contraction=0.5):
+        self.rhs, self.jac = rhs, jac
+        self.ny, self.band, self.nnz = ny, band, nnz
+        self.tol, self.dh_rtol = tol, dh_rtol
+        self.max_iter_reuse, self.max_contraction = max_iter_reuse, max_contraction
+        self.f = np.empty(ny)
+        self.r = np.empty(ny)  # residual, overwritten by the correction in ``_lu_solve``
+        if band is not None:
+            ml, mu = band
+            self.j = np.empty((ml+mu+1, ny))
+            self.jac_args = (self.j,)
+            self.W = np.empty((2*ml+mu+1, ny), order='F')  # dgbtrf needs ml extra rows for fill-in
+        elif nnz >= 0:
+            self.j = np.empty(nnz)
+            self.colptrs = np.empty(ny+1, dtype=np.int32)
+            self.rowvals = np.empty(nnz, dtype=np.int32)
+            self.jac_args = (self.j, self.colptrs, self.rowvals)
+        else:
+            self.j = np.empty((ny, ny))
+            self.jac_args = (self.j,)
+            self.W = np.empty((ny, ny), order='F')
+            self.diag = np.diag_indices(ny)
+        self.lu_piv = None
+        self.h = None
+        self.refactor = True
+        self.njev = 0
+
+    def _factorize(self, x, y, h):
+        self.jac(x, y, *self.jac_args)
+        self.njev += 1
+        if self.band is not None:
+            ml, mu = self.band
+            self.W[:ml, :] = 0
+            np.multiply(h, self.j, out=self.W[ml:, :])
+            self.W[ml+mu, :] -= 1
+            lu, piv, info = dgbtrf(self.W, ml, mu, overwrite_ab=True)
+        elif self.nnz >= 0:
+            J = csc_matrix((self.j, self.rowvals, self.colptrs), shape=(self.ny, self.ny))
+            self.lu_piv = splu((h*J - sparse_identity(self.ny, format='csc')).tocsc())
+        else:
+            np.multiply(h, self.j, out=self.W)
+            self.W[self.diag] -= 1
+            lu, piv, info = dgetrf(self.W, overwrite_a=True)
+        if self.nnz < 0 or self.band is not None:
+            if info > 0:
+                warnings.warn("Diagonal number %d is exactly zero. Singular matrix." % info)
+            self.lu_piv = lu, piv
+        self.h = h
+        self.refactor = False
+
+    def _lu_solve(self, b):
+        if self.band is not None:
+            x, info = dgbtrs(self.lu_piv[0], self.band[0], self.band[1], b, self.lu_piv[1], overwrite_b=True)
+        elif self.nnz >= 0:
+            x = self.lu_piv.solve(b)
+        else:
+            x, info = dgetrs(self.lu_piv[0], self.lu_piv[1], b, overwrite_b=True)
+        return x
+
+    def solve(self, x_old, x, y, ynew):
+        """ Iterates ``ynew`` (initial guess, updated in place) to convergence. """
+        h = x - x_old
+        fresh = self.refactor or abs(h - self.h) > self.dh_rtol*abs(self.h)
+        if fresh:
+            self._factorize(x_old, y, h)
+        f, r = self.f, self.r
+        niter = 0
+        norm_delta_ynew = float('inf')
+        while norm_delta_ynew > self.tol:
+            self.rhs(x, ynew, f)
+            _newton_residual(ynew, y, f, h, r)
+            niter += 1
+            prev_norm, norm_delta_ynew = norm_delta_ynew, _newton_update(ynew, self._lu_solve(r))
+            if not fresh and norm_delta_ynew > self.max_contraction*prev_norm:
+                self._factorize(x, ynew, h)
+                fresh = True
+        self.refactor = niter > self.max_iter_reuse
+        return ynew
 
 
 class EulerBackward_example_integrator:
@@ -111,31 +298,25 @@ class EulerBackward_example_integrator:
     integrate_adaptive = None
 
     @staticmethod
-    def integrate_predefined(rhs, jac, y0, xout, **kwargs):
+    def integrate_predefined(rhs, jac, y0, xout, lband=None, uband=None, nnz=-1, **kwargs):
         if kwargs:
             warnings.warn("Ignoring keyword-argumtents: %s" % ', '.join(kwargs.keys()))
         x_old = xout[0]
-        yout = [y0[:]]
-        f = np.empty(len(y0))
-        j = np.empty((len(y0), len(y0)))
-        I = np.eye(len(y0))
+        ny = len(y0)
+        yout = np.empty((len(xout), ny))
+        yout[0, :] = y0
+        f = np.empty(ny)
+        newton = _ImplicitEulerNewton(rhs, jac, ny, None if lband is None else (lband, uband), nnz)
         for i, x in enumerate(xout[1:], 1):
-            y = yout[-1]
+            y = yout[i-1, :]
+            ynew = yout[i, :]
             h = x - x_old
-            jac(x_old, y, j)
-            lu_piv = lu_factor(h*j - I)
             rhs(x, y, f)
-            ynew = y + f*h
-            norm_delta_ynew = float('inf')
-            while norm_delta_ynew > 1e-12:
-                rhs(x, ynew, f)
-                delta_ynew = lu_solve(lu_piv, ynew - y - f*h)
-                ynew += delta_ynew
-                norm_delta_ynew = np.sqrt(np.sum(np.square(delta_ynew)))
-
-            yout.append(ynew)
+            np.multiply(h, f, out=ynew)
+            ynew += y
+            newton.solve(x_old, x, y, ynew)
             x_old = x
-        return np.array(yout), {'nfev': (len(xout)-1)}
+        return yout, {'nfev': (len(xout)-1), 'njev': newton.njev}
 
 
 class Trapezoidal_example_integrator:
@@ -144,29 +325,26 @@ class Trapezoidal_example_integrator:
     integrate_adaptive = None
 
     @staticmethod
-    def integrate_predefined(rhs, jac, y0, xout, **kwargs):
+    def integrate_predefined(rhs, jac, y0, xout, lband=None, uband=None, nnz=-1, **kwargs):
         if kwargs:
             warnings.warn("Ignoring keyword-argumtents: %s" % ', '.join(kwargs.keys()))
         x_old = xout[0]
-        yout = [y0[:]]
-        f = np.empty(len(y0))
-        j = np.empty((len(y0), len(y0)))
-        I = np.eye(len(y0))
+        ny = len(y0)
+        yout = np.empty((len(xout), ny))
+        yout[0, :] = y0
+        f = np.empty(ny)
+        newton = _ImplicitEulerNewton(rhs, jac, ny, None if lband is None else (lband, uband), nnz)
+        euler_fw_dy = np.empty(ny)
+        ynew = np.empty(ny)
         for i, x in enumerate(xout[1:], 1):
-            y = yout[-1]
+            y = yout[i-1, :]
             h = x - x_old
-            jac(x_old, y, j)
-            lu_piv = lu_factor(h*j - I)
             rhs(x, y, f)
-            euler_fw_dy = f*h
-            ynew = y + euler_fw_dy
-            norm_delta_ynew = float('inf')
-            while norm_delta_ynew > 1e-12:
-                rhs(x, ynew, f)
-                delta_ynew = lu_solve(lu_piv, ynew - y - f*h)
-                ynew += delta_ynew
-                norm_delta_ynew = np.sqrt(np.sum(np.square(delta_ynew)))
-
-            yout.append((ynew + y + euler_fw_dy)/2)
+            np.multiply(h, f, out=euler_fw_dy)
+            np.add(y, euler_fw_dy, out=ynew)
+            newton.solve(x_old, x, y, ynew)
+            np.add(ynew, y, out=yout[i, :])
+            yout[i, :] += euler_fw_dy
+            yout[i, :] /= 2
             x_old = x
-        return np.array(yout), {'nfev': (len(xout)-1)}
+        return yout, {'nfev': (len(xout)-1), 'njev': newton.njev}
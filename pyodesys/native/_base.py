@@ -2,9 +2,8 @@
 from __future__ import (absolute_import, division, print_function)
 
 from datetime import datetime as dt
-from functools import reduce
+from itertools import chain
 import logging
-from operator import add
 import os
 import shutil
 import sys
@@ -132,11 +131,11 @@ class _NativeCodeBase(Cpp_Code):
         nnz = self.odesys.nnz
         all_exprs = self.odesys.exprs + all_invar
         if jac is not False and nnz < 0:
-            jac_dfdx = list(reduce(add, jac.tolist() + self.odesys.get_dfdx().tolist()))
+            jac_dfdx = list(chain.from_iterable(jac.tolist() + self.odesys.get_dfdx().tolist()))
             all_exprs += tuple(jac_dfdx)
             nj = len(jac_dfdx)
         elif jac is not False and nnz >= 0:
-            jac_dfdx = list(reduce(add, jac.tolist()))
+            jac_dfdx = list(chain.from_iterable(jac.tolist()))
             all_exprs += tuple(jac_dfdx)
             nj = len(jac_dfdx)
         else:
@@ -78,27 +78,6 @@ def plot_result(x, y, indices=None, plot_kwargs_cb=None, ax=None,
 
     if ax is None:
         _fig, ax = plt.subplots(1, 1, **(fig_kw or {}))
-    if plot_kwargs_cb is None:
-        def plot_kwargs_cb(idx, lines=False, markers=False, labels=None):
-
-            kw = {'c': c[idx % len(c)]}
-
-            if lines:
-                kw['ls'] = ls[idx % len(ls)]
-                if isinstance(lines, float):
-                    kw['alpha'] = lines
-            else:
-                kw['ls'] = 'None'
-
-            if markers:
-                kw['marker'] = m[idx % len(m)]
-
-            if labels:
-                kw['label'] = labels[idx]
-            return kw
-    else:
-        plot_kwargs_cb = plot_kwargs_cb or (lambda idx: {})
-
     if interpolate is None:
         interpolate = y.ndim == 3 and y.shape[1] > 1
 
@@ -109,10 +88,30 @@ def plot_result(x, y, indices=None, plot_kwargs_cb=None, ax=None,
 
     if indices is None:
         indices = range(_y.shape[-1])  # e.g. PartiallySolvedSys
+    else:
+        indices = list(indices)  # iterated more than once below
     if lines is None:
         lines = interpolate in (None, False)
     markers = len(x) < m_lim
 
+    if plot_kwargs_cb is None:
+        # cycle through the styles once per index rather than once per call:
+        c_cycle = {idx: c[idx % len(c)] for idx in indices}
+        ls_cycle = {idx: ls[idx % len(ls)] for idx in indices}
+        m_cycle = {idx: m[idx % len(m)] for idx in indices}
+
+        def plot_kwargs_cb(idx, lines=False, markers=False, labels=None):
+            kw = {'c': c_cycle[idx], 'ls': ls_cycle[idx] if lines else 'None'}
+            if lines and isinstance(lines, float):
+                kw['alpha'] = lines
+            if markers:
+                kw['marker'] = m_cycle[idx]
+            if labels:
+                kw['label'] = labels[idx]
+            return kw
+    else:
+        plot_kwargs_cb = plot_kwargs_cb or (lambda idx: {})
+
     if yerr is not None:
         for idx in indices:
             clr = plot_kwargs_cb(idx)['c']
@@ -169,12 +168,13 @@ def plot_result(x, y, indices=None, plot_kwargs_cb=None, ax=None,
 
         if interp_from_deriv is None:
             import scipy.interpolate
-            interp_from_deriv = scipy.interpolate.BPoly.from_derivatives
-
-        y2 = np.empty((x_plot.size, _y.shape[-1]))
-        for idx in range(_y.shape[-1]):
-            interp_cb = interp_from_deriv(x, y[..., idx])
-            y2[:, idx] = interp_cb(x_plot)
+            # BPoly broadcasts over trailing axes, i.e. all components in one go:
+            y2 = scipy.interpolate.BPoly.from_derivatives(x, y)(x_plot)
+        else:
+            y2 = np.empty((x_plot.size, _y.shape[-1]))
+            for idx in range(_y.shape[-1]):
+                interp_cb = interp_from_deriv(x, y[..., idx])
+                y2[:, idx] = interp_cb(x_plot)
 
         for idx in indices:
             ax.plot(x_plot, y2[:, idx], **plot_kwargs_cb(
@@ -266,13 +266,15 @@ def info_vlines(ax, xout, info, vline_colors=('maroon', 'purple'),
     """
 
     nvk = len(vline_keys)
+    if any(key.startswith('fe_') for key in vline_keys):
+        if fpes is None:
+            raise ValueError("Need fpes when vline_keys contain fe_*")
+        fpes_arr = np.asarray(info['fpes'])
     for idx, key in enumerate(vline_keys):
         if key == 'steps':
             vlines = xout
         elif key.startswith('fe_'):
-            if fpes is None:
-                raise ValueError("Need fpes when vline_keys contain fe_*")
-            vlines = xout[info['fpes'] & fpes[key.upper()] > 0]
+            vlines = xout[np.flatnonzero(fpes_arr & fpes[key.upper()])]
         else:
             vlines = info[key] if post_proc is None else post_proc(info[key])
 
@@ -26,17 +26,17 @@ class Result(object):
     def __len__(self):
         return 3
 
+    def __iter__(self):
+        return iter((self.xout, self.yout, self.info))
+
     def __getitem__(self, key):
-        if key == 0:
+        if key == 0 and key is not False:
             return self.xout
-        elif key == 1:
+        elif key == 1 and key is not True:
             return self.yout
         elif key == 2:
             return self.info
-        elif key == 3:
-            raise StopIteration
-        else:
-            raise KeyError("Invalid key: %s (for backward compatibility reasons)." % str(key))
+        raise KeyError("Invalid key: %s (for backward compatibility reasons)." % str(key))
 
     def named_param(self, param_name):
         return self.params[self.odesys.param_names.index(param_name)]
@@ -161,22 +161,12 @@ class Result(object):
             internal routine will use ``self.j_cb`` and ``scipy.linalg.svd``.
 
         """
-        if eigenvals_cb is None:
-            if self.odesys.band is not None:
-                raise NotImplementedError
-            eigenvals_cb = self.odesys._jac_eigenvals_svd
-
         if xyp is None:
             x, y, intern_p = self._internals()
         else:
             x, y, intern_p = self.pre_process(*xyp)
 
-        singular_values = []
-        for xval, yvals in zip(x, y):
-            singular_values.append(eigenvals_cb(xval, yvals, intern_p))
-
-        return (np.abs(singular_values).max(axis=-1) /
-                np.abs(singular_values).min(axis=-1))
+        return self.odesys._stiffness_ratio(x, y, intern_p, eigenvals_cb)
 
     def _plot(self, cb, x=None, y=None, legend=None, **kwargs):
         if x is None:
@@ -17,7 +17,7 @@ import numpy as np
 from .util import import_
 from .core import ODESys, RecoverableError
 from .util import (
-    transform_exprs_dep, transform_exprs_indep, _ensure_4args, _Callback
+    transform_exprs_dep, transform_exprs_indep, _ensure_4args, _Callback, _callback_args, merge_dicts
 )
 
 Backend = import_('sym', 'Backend')
@@ -97,6 +97,7 @@ def _is_autonomous(indep, exprs):
 
 
 def _skip(indices, iterable, as_array=True):
+    indices = set(indices)
     result = [elem for idx, elem in enumerate(iterable) if idx not in indices]
     return np.asarray(result) if as_array else result
 
@@ -104,14 +105,10 @@ def _skip(indices, iterable, as_array=True):
 def _reinsert(indices, arr, new):
     trail_dim = arr.shape[-1]+len(indices)
     new_arr = np.empty(arr.shape[:-1] + (trail_dim,))
-    idx_arr, idx_insert = 0, 0
-    for glbl in range(trail_dim):
-        if glbl in indices:
-            new_arr[..., glbl] = new[..., idx_insert]
-            idx_insert += 1
-        else:
-            new_arr[..., glbl] = arr[..., idx_arr]
-            idx_arr += 1
+    mask = np.zeros(trail_dim, dtype=bool)
+    mask[list(indices)] = True
+    new_arr[..., mask] = new
+    new_arr[..., ~mask] = arr
     return new_arr
 
 
@@ -181,6 +178,21 @@ class SymbolicSys(ODESys):
         When ``True``, jacobian will be derived and stored (if ``jac = True``)
         in compressed sparse column (CSC) format and the jacobian callback
         will return an instance of ``scipy.sparse.csc_matrix``.
+    lambdify_kw : dict (default: ``None``)
+        Keyword arguments passed on to ``backend.Lambdify`` when generating
+        callbacks, on top of the default ``dict(cse=True)`` (common subexpressions,
+        e.g. shared between jacobian entries, are evaluated only once per call;
+        ``cse`` is dropped for backends whose ``Lambdify`` does not accept it).
+        With one of the SymPy based backends, ``dict(use_numba=True)`` compiles
+        the callbacks using ``numba`` (at the cost of a one-time compilation).
+        With ``backend='symengine'`` (or ``'sympysymengine'``) the callbacks are
+        evaluated by ``symengine.Lambdify`` in C++, ``dict(backend='llvm')`` makes
+        it JIT-compile the expressions to machine code. The key ``cachedir`` is not
+        passed on but gives a directory where the generated callbacks are pickled
+        (keyed by a hash of the expressions) and reused, e.g.
+        ``dict(backend='llvm', cachedir='/tmp/llvm_cache')`` (only callbacks which
+        can be pickled, i.e. symengine's, are cached). The cache is loaded using
+        ``pickle``, so only use a directory which is trusted.
     \\*\\*kwargs:
         See :py:class:`ODESys`
 
@@ -217,7 +229,7 @@ class SymbolicSys(ODESys):
                       'linear_invariants', 'linear_invariant_names',
                       'nonlinear_invariants', 'nonlinear_invariant_names',
                       'to_arrays_callbacks', '_indep_autonomous_key',
-                      'taken_names', 'numpy')
+                      'taken_names', 'numpy', 'lambdify_kw')
     append_iv = True
 
     @property
@@ -232,12 +244,12 @@ class SymbolicSys(ODESys):
                  jtimes=False, first_step_expr=None, roots=None, backend=None, lower_bounds=None,
                  upper_bounds=None, linear_invariants=None, nonlinear_invariants=None,
                  linear_invariant_names=None, nonlinear_invariant_names=None, steady_state_root=False,
-                 init_indep=None, init_dep=None, sparse=False, **kwargs):
+                 init_indep=None, init_dep=None, sparse=False, lambdify_kw=None, **kwargs):
         self.dep, self.exprs = zip(*dep_exprs.items()) if isinstance(dep_exprs, dict) else zip(*dep_exprs)
         self.indep = indep
         if params is True or params is None:
-            all_free = tuple(filter(lambda x: x not in self.dep + (self.indep,),
-                                    sorted(set.union(*[expr.free_symbols for expr in self.exprs]), key=str)))
+            taken = set(self.dep + (self.indep,))
+            all_free = tuple(sorted(set.union(*[expr.free_symbols for expr in self.exprs]) - taken, key=str))
             if params is None and all_free:
                 raise ValueError("Pass params explicitly or pass True to have them deduced.")
             params = all_free
@@ -248,6 +260,7 @@ class SymbolicSys(ODESys):
         self._dfdx = dfdx
         self.first_step_expr = first_step_expr
         self.be = Backend(backend)
+        self.lambdify_kw = merge_dicts(dict(cse=True), lambdify_kw or {})
 
         if steady_state_root:
             if steady_state_root is True:
@@ -282,6 +295,8 @@ class SymbolicSys(ODESys):
         if _param_names is True:
             kwargs['param_names'] = [p.name for p in self.params]
 
+        self._callback_args = _callback_args(self.indep, self.dep, self.params)  # shared by _callback_factory
+        self._j_dfdx_cb = None  # fused jacobian & dfdx callback, created on demand by _jac_and_dfdx
         self.sparse = sparse  # needed by get_j_ty_callback
         self.band = kwargs.get('band', None)  # needed by get_j_ty_callback
         # bounds needed by get_f_ty_callback:
@@ -541,7 +556,7 @@ class SymbolicSys(ODESys):
         drop_idxs = [ori.params.index(par) for par in par_subs]
         params = _skip(drop_idxs, ori.params, False) + list(new_pars)
         back_substitute = _Callback(ori.indep, ori.dep, params, list(par_subs.values()),
-                                    Lambdify=ori.be.Lambdify)
+                                    Lambdify=ori.be.Lambdify, lambdify_kw=ori.lambdify_kw)
 
         def recalc_params(t, y, p):
             rev = back_substitute(t, y, p)
@@ -635,15 +650,22 @@ class SymbolicSys(ODESys):
         return self.__class__(zip(new_dep, new_exprs), indep=new_indep, params=self.params, **new_kw)
 
     def get_jac(self):
-        """ Derives the jacobian from ``self.exprs`` and ``self.dep``. """
+        """ Derives the jacobian from ``self.exprs`` and ``self.dep``.
+
+        When :attr:`band` is set only the diagonals are derived, and they are
+        returned in packed (LAPACK) banded storage of shape ``(ml+mu+1, ny)``.
+        With ``sparse=True`` the non-zero entries are returned in CSC order
+        (see :attr:`_colptrs` & :attr:`_rowvals`).
+        """
         if self._jac is True:
             if self.sparse is True:
                 self._jac, self._colptrs, self._rowvals = self.be.sparse_jacobian_csc(self.exprs, self.dep)
             elif self.band is not None:  # Banded
                 self._jac = self.be.banded_jacobian(self.exprs, self.dep, *self.band)
             else:
-                f = self.be.Matrix(1, self.ny, self.exprs)
-                self._jac = f.jacobian(self.be.Matrix(1, self.ny, self.dep))
+                # column vectors: symengine's jacobian does not accept row vectors
+                f = self.be.Matrix(self.ny, 1, self.exprs)
+                self._jac = f.jacobian(self.be.Matrix(self.ny, 1, self.dep))
         elif self._jac is False:
             return False
 
@@ -659,9 +681,8 @@ class SymbolicSys(ODESys):
             v = tuple(self.be.Dummy('v_{0}'.format(i)) for i in range(self.ny))
             f = self.be.Matrix(1, self.ny, self.exprs)
             f = f.subs([(x_i, x_i + r * v_i) for x_i, v_i in zip(self.dep, v)])
-            return v, self.be.flatten(f.diff(r).subs(r, 0))
-        else:
-            return tuple(zip(*self._jtimes))
+            self._jtimes = tuple(zip(v, self.be.flatten(f.diff(r).subs(r, 0))))
+        return tuple(zip(*self._jtimes))
 
     def jacobian_singular(self):
         """ Returns True if Jacobian is singular, else False. """
@@ -684,29 +705,44 @@ class SymbolicSys(ODESys):
         return self._dfdx
 
     def _callback_factory(self, exprs):
-        return _Callback(self.indep, self.dep, self.params, exprs, Lambdify=self.be.Lambdify)
+        return _Callback(self.indep, self.dep, self.params, exprs, Lambdify=self.be.Lambdify,
+                         lambdify_kw=self.lambdify_kw, args=self._callback_args)
 
     def get_f_ty_callback(self):
         """ Generates a callback for evaluating ``self.exprs``. """
         cb = self._callback_factory(self.exprs)
         lb = self.lower_bounds
         ub = self.upper_bounds
-        if lb is not None or ub is not None:
+        if lb is None and ub is None:
+            return cb
+        _widened = [None, None, None]  # integration kwargs, lb - 10*atol, ub + 10*atol
+
+        def _widened_bounds():
+            # only recomputed when a new integration is started (new kwargs dict)
+            kw = self._current_integration_kwargs
+            if kw is not _widened[0]:
+                tol = 10*np.asarray(kw['atol'])
+                _widened[:] = kw, None if lb is None else lb - tol, None if ub is None else ub + tol
+            return _widened
+
+        # the wrapper is specialized for the bounds given:
+        if ub is None:
+            def _bounds_wrapper(t, y, p=(), be=None):
+                if np.any(y < _widened_bounds()[1]):
+                    raise RecoverableError
+                return cb(t, np.maximum(y, lb), p, be)
+        elif lb is None:
             def _bounds_wrapper(t, y, p=(), be=None):
-                if lb is not None:
-                    if np.any(y < lb - 10*self._current_integration_kwargs['atol']):
-                        raise RecoverableError
-                    y = np.array(y)
-                    y[y < lb] = lb[y < lb]
-                if ub is not None:
-                    if np.any(y > ub + 10*self._current_integration_kwargs['atol']):
-                        raise RecoverableError
-                    y = np.array(y)
-                    y[y > ub] = ub[y > ub]
-                return cb(t, y, p, be)
-            return _bounds_wrapper
+                if np.any(y > _widened_bounds()[2]):
+                    raise RecoverableError
+                return cb(t, np.minimum(y, ub), p, be)
         else:
-            return cb
+            def _bounds_wrapper(t, y, p=(), be=None):
+                _, lower, upper = _widened_bounds()
+                if np.any(y < lower) or np.any(y > upper):
+                    raise RecoverableError
+                return cb(t, np.clip(y, lb, ub), p, be)
+        return _bounds_wrapper
 
     def get_j_ty_callback(self):
         """ Generates a callback for evaluating the jacobian. """
@@ -732,6 +768,27 @@ class SymbolicSys(ODESys):
             return None
         return self._callback_factory(dfdx_exprs)
 
+    def _get_j_dfdx_callback(self):
+        """ Generates a single callback for the (dense or banded) jacobian and dfdx.
+
+        Evaluating both in one go lets subexpressions common to the two be shared.
+        """
+        j_exprs, dfdx_exprs = self.get_jac(), self.get_dfdx()
+        if j_exprs is False or dfdx_exprs is False or self.sparse:
+            return None
+        nj, j_shape = len(j_exprs), j_exprs.shape
+        cb = self._callback_factory(list(j_exprs) + list(dfdx_exprs))  # row-major
+
+        def j_dfdx_cb(x, y, p=()):
+            out = cb(x, y, p)
+            return out[..., :nj].reshape(out.shape[:-1] + j_shape), out[..., nj:]
+        return j_dfdx_cb
+
+    def _jac_and_dfdx(self, x, y, p=()):
+        if self._j_dfdx_cb is None:
+            self._j_dfdx_cb = self._get_j_dfdx_callback() or super(SymbolicSys, self)._jac_and_dfdx
+        return self._j_dfdx_cb(x, y, p)
+
     def get_jtimes_callback(self):
         """ Generate a callback fro evaluating the jacobian-vector product."""
         jtimes = self.get_jtimes()
@@ -739,7 +796,7 @@ class SymbolicSys(ODESys):
             return None
         v, jtimes_exprs = jtimes
         return _Callback(self.indep, tuple(self.dep) + tuple(v), self.params,
-                         jtimes_exprs, Lambdify=self.be.Lambdify)
+                         jtimes_exprs, Lambdify=self.be.Lambdify, lambdify_kw=self.lambdify_kw)
 
     def get_first_step_callback(self):
         if self.first_step_expr is None:
@@ -758,6 +815,17 @@ class SymbolicSys(ODESys):
             return None
         return self._callback_factory(invar)
 
+    def _jac_singular_values(self, x, y, intern_p):
+        if self.sparse or self.j_cb is None:
+            return super(SymbolicSys, self)._jac_singular_values(x, y, intern_p)
+        # the jacobian callback evaluates all points at once: (nx, ny, ny)
+        return np.linalg.svd(self.j_cb(x, y, intern_p), compute_uv=False)
+
+    def _eigenvals_at(self, eigenvals_cb, x, y, intern_p):
+        if isinstance(eigenvals_cb, _Callback):
+            return eigenvals_cb(x, y, intern_p)  # broadcasts over all points in one call
+        return super(SymbolicSys, self)._eigenvals_at(eigenvals_cb, x, y, intern_p)
+
     def _get_analytic_stiffness_cb(self):
         J = self.get_jac()
         eig_vals = list(J.eigenvals().keys())
@@ -837,10 +905,10 @@ class TransformedSys(SymbolicSys):
             self.dep_fw, self.dep_bw = zip(*dep_transf)
             exprs = transform_exprs_dep(
                 self.dep_fw, self.dep_bw, list(zip(dep, exprs)), check_transforms)
-            bw_subs = list(zip(dep, self.dep_bw))
-            all_invariants = [invar.subs(bw_subs) for invar in all_invariants]
+            bw_subs = dict(zip(dep, self.dep_bw))
+            all_invariants = [invar.xreplace(bw_subs) for invar in all_invariants]
             if roots is not None:
-                roots = [r.subs(bw_subs) for r in roots]
+                roots = [r.xreplace(bw_subs) for r in roots]
         else:
             self.dep_fw, self.dep_bw = None, None
 
@@ -848,9 +916,10 @@ class TransformedSys(SymbolicSys):
             self.indep_fw, self.indep_bw = indep_transf
             exprs = transform_exprs_indep(
                 self.indep_fw, self.indep_bw, list(zip(dep, exprs)), indep, check_transforms)
-            all_invariants = [invar.subs(indep, self.indep_bw) for invar in all_invariants]
+            bw_subs = {indep: self.indep_bw}
+            all_invariants = [invar.xreplace(bw_subs) for invar in all_invariants]
             if roots is not None:
-                roots = [r.subs(indep, self.indep_bw) for r in roots]
+                roots = [r.xreplace(bw_subs) for r in roots]
         else:
             self.indep_fw, self.indep_bw = None, None
 
@@ -874,9 +943,16 @@ class TransformedSys(SymbolicSys):
             **kwargs)
         # the pre- and post-processors need callbacks:
         self.f_dep = None if self.dep_fw is None else self._callback_factory(self.dep_fw)
-        self.b_dep = None if self.dep_bw is None else self._callback_factory(self.dep_bw)
         self.f_indep = None if self.indep_fw is None else self._callback_factory([self.indep_fw])
-        self.b_indep = None if self.indep_bw is None else self._callback_factory([self.indep_bw])
+        if self.indep_bw is not None and self.dep_bw is not None:
+            # the back transforms share arguments, they are generated (and evaluated) as one callback:
+            self._b_indep_dep = self._callback_factory([self.indep_bw] + list(self.dep_bw))
+            self.b_indep = lambda x, y, p=(): self._b_indep_dep(x, y, p)[..., :1]
+            self.b_dep = lambda x, y, p=(): self._b_indep_dep(x, y, p)[..., 1:]
+        else:
+            self._b_indep_dep = None
+            self.b_dep = None if self.dep_bw is None else self._callback_factory(self.dep_bw)
+            self.b_indep = None if self.indep_bw is None else self._callback_factory([self.indep_bw])
         _x, _p = float('nan'), [float('nan')]*len(self.params)
         self.lower_bounds = lower_b if self.f_dep is None or lower_b is None else self.f_dep(_x, lower_b, _p)
         self.upper_bounds = upper_b if self.f_dep is None or upper_b is None else self.f_dep(_x, upper_b, _p)
@@ -942,20 +1018,22 @@ class TransformedSys(SymbolicSys):
         else:
             return zip(*[self._back_transform_out(_x, _y, _p) for
                          _x, _y, _p in zip(xout, yout, params)])
-        x = xout if self.b_indep is None else self.b_indep(xout, yout, params).squeeze(axis=-1)
-        y = yout if self.b_dep is None else self.b_dep(xout, yout, params)
+        if self._b_indep_dep is not None:
+            xy = self._b_indep_dep(xout, yout, params)
+            x, y = xy[..., 0], xy[..., 1:]
+        else:
+            x = xout if self.b_indep is None else self.b_indep(xout, yout, params).squeeze(axis=-1)
+            y = yout if self.b_dep is None else self.b_dep(xout, yout, params)
         return x, y, params
 
     def _forward_transform_xy(self, x, y, p):
         x, y, p = map(np.asarray, (x, y, p))
-        if y.ndim == 1:
-            _x = x if self.f_indep is None else self.f_indep(x, y[..., None, :], p[..., None, :])[..., 0]
-            _y = y if self.f_dep is None else self.f_dep(x[..., 0], y, p)
-            return _x, _y, p
-        elif y.ndim == 2:
-            return zip(*[self._forward_transform_xy(_x, _y, _p) for _x, _y, _p in zip(x, y, p)])
-        else:
+        if y.ndim not in (1, 2):
             raise NotImplementedError("Don't know what to do with %d dimensions." % y.ndim)
+        # the callbacks broadcast, so several sets of (x, y0, p) (y.ndim == 2) are transformed at once:
+        _x = x if self.f_indep is None else self.f_indep(x, y[..., None, :], p[..., None, :])[..., 0]
+        _y = y if self.f_dep is None else self.f_dep(x[..., 0], y, p)
+        return _x, _y, p
 
 
 def symmetricsys(dep_tr=None, indep_tr=None, SuperClass=TransformedSys, **kwargs):
@@ -1122,15 +1200,6 @@ class ScaledSys(TransformedSys):
         )
 
 
-def _append(arr, *iterables):
-    if isinstance(arr, np.ndarray):
-        return np.concatenate((arr,) + iterables)
-    arr = arr[:]
-    for iterable in iterables:
-        arr += type(arr)(iterable)
-    return arr
-
-
 class PartiallySolvedSystem(SymbolicSys):
     """ Use analytic expressions for some dependent variables
 
@@ -1209,33 +1278,36 @@ class PartiallySolvedSystem(SymbolicSys):
         self.free_names = None if self._ori_sys.names is None else free_names
         self.free_latex_names = None if self._ori_sys.latex_names is None else free_latex_names
         self.append_iv = kwargs.get('append_iv', False)
-        new_pars = _append(self._ori_sys.params, (init_indep,), init_dep)
+        new_pars = tuple(self._ori_sys.params) + (init_indep,) + tuple(init_dep)
         self.analytic_cb = self._get_analytic_callback(
             self._ori_sys, list(self.analytic_exprs.values()), new_dep, new_pars)
         self.ori_analyt_idx_map = OrderedDict([(self.original_dep.index(dep), idx)
                                                for idx, dep in enumerate(self.analytic_exprs)])
         self.ori_remaining_idx_map = {self.original_dep.index(dep): idx for
                                       idx, dep in enumerate(new_dep)}
-        new_exprs = [expr.subs(self.analytic_exprs) for idx, expr in
+        self._ori_analyt_idxs = np.array(list(self.ori_analyt_idx_map), dtype=int)  # in order of analytic_cb
+        self._ori_remaining_idxs = np.array(sorted(self.ori_remaining_idx_map), dtype=int)
+        # xreplace is a purely structural (simultaneous) replacement, cheaper than subs:
+        _analytic_subs = {dep: _be.sympify(expr) for dep, expr in self.analytic_exprs.items()}
+        new_exprs = [expr.xreplace(_analytic_subs) for idx, expr in
                      enumerate(self._ori_sys.exprs) if idx not in self.ori_analyt_idx_map]
-        new_roots = None if roots is None else [expr.subs(self.analytic_exprs) for expr in roots]
+        new_roots = None if roots is None else [expr.xreplace(_analytic_subs) for expr in roots]
         new_kw = kwargs.copy()
         for attr in self._attrs_to_copy:
             if attr not in new_kw and getattr(self._ori_sys, attr, None) is not None:
                 new_kw[attr] = getattr(self._ori_sys, attr)
 
         if 'lower_bounds' not in new_kw and getattr(self._ori_sys, 'lower_bounds', None) is not None:
-            new_kw['lower_bounds'] = _skip(self.ori_analyt_idx_map, self._ori_sys.lower_bounds)
+            new_kw['lower_bounds'] = self._ori_sys.lower_bounds[self._ori_remaining_idxs]
 
         if 'upper_bounds' not in new_kw and getattr(self._ori_sys, 'upper_bounds', None) is not None:
-            new_kw['upper_bounds'] = _skip(self.ori_analyt_idx_map, self._ori_sys.upper_bounds)
+            new_kw['upper_bounds'] = self._ori_sys.upper_bounds[self._ori_remaining_idxs]
 
         if kwargs.get('linear_invariants', None) is None:
             if new_kw.get('linear_invariants', None) is not None:
                 if new_kw['linear_invariants'].shape[1] != self._ori_sys.ny:
                     raise ValueError("Unexpected number of columns in original linear_invariants.")
-                new_kw['linear_invariants'] = new_kw['linear_invariants'][:, [i for i in range(self._ori_sys.ny)
-                                                                              if i not in self.ori_analyt_idx_map]]
+                new_kw['linear_invariants'] = new_kw['linear_invariants'][:, self._ori_remaining_idxs.tolist()]
 
         def partially_solved_pre_processor(x, y, p):
             # if isinstance(y, dict) and not self.dep_by_name:
@@ -1246,7 +1318,7 @@ class PartiallySolvedSystem(SymbolicSys):
             if y.ndim == 2:
                 return zip(*[partially_solved_pre_processor(_x, _y, _p)
                              for _x, _y, _p in zip(x, y, p)])
-            return (x, _skip(self.ori_analyt_idx_map, y), _append(p, [x[0]], y))
+            return (x, y[..., self._ori_remaining_idxs], np.concatenate((p, x[:1], y)))
 
         def partially_solved_post_processor(x, y, p):
             try:
@@ -1257,12 +1329,8 @@ class PartiallySolvedSystem(SymbolicSys):
                 return zip(*[partially_solved_post_processor(_x, _y, _p)
                              for _x, _y, _p in zip(x, y, p)])
             new_y = np.empty(y.shape[:-1] + (y.shape[-1]+len(self.analytic_exprs),))
-            analyt_y = self.analytic_cb(x, y, p)
-            for idx in range(self._ori_sys.ny):
-                if idx in self.ori_analyt_idx_map:
-                    new_y[..., idx] = analyt_y[..., self.ori_analyt_idx_map[idx]]
-                else:
-                    new_y[..., idx] = y[..., self.ori_remaining_idx_map[idx]]
+            new_y[..., self._ori_analyt_idxs] = self.analytic_cb(x, y, p)
+            new_y[..., self._ori_remaining_idxs] = y
             return x, new_y, p[:-(1+self._ori_sys.ny)]
 
         new_kw['pre_processors'] = self._ori_sys.pre_processors + [partially_solved_pre_processor]
@@ -1328,15 +1396,17 @@ class PartiallySolvedSystem(SymbolicSys):
             }
 
         ori_li_nms = ori_sys.linear_invariant_names or ()
-        new_lin_invar = [[cell for ci, cell in enumerate(row) if ci not in list(zip(*row_tgt))[1]]
-                         for ri, row in enumerate(A.tolist()) if ri not in list(zip(*row_tgt))[0]]
-        new_lin_i_nms = [nam for ri, nam in enumerate(ori_li_nms) if ri not in list(zip(*row_tgt))[0]]
+        tgt_rows, tgt_cols = map(set, zip(*row_tgt))
+        new_lin_invar = [[cell for ci, cell in enumerate(row) if ci not in tgt_cols]
+                         for ri, row in enumerate(A.tolist()) if ri not in tgt_rows]
+        new_lin_i_nms = [nam for ri, nam in enumerate(ori_li_nms) if ri not in tgt_rows]
         return cls(ori_sys, analytic_factory, linear_invariants=new_lin_invar,
                    linear_invariant_names=new_lin_i_nms, **kwargs)
 
     @staticmethod
     def _get_analytic_callback(ori_sys, analytic_exprs, new_dep, new_params):
-        return _Callback(ori_sys.indep, new_dep, new_params, analytic_exprs, Lambdify=ori_sys.be.Lambdify)
+        return _Callback(ori_sys.indep, new_dep, new_params, analytic_exprs, Lambdify=ori_sys.be.Lambdify,
+                         lambdify_kw=ori_sys.lambdify_kw)
 
     def __getitem__(self, key):
         ori_dep = self.original_dep[self.names.index(key)]
@@ -1353,7 +1423,7 @@ class PartiallySolvedSystem(SymbolicSys):
                 except TypeError:
                     pass
                 else:
-                    atol = [atol[idx] for idx in _skip(self.ori_analyt_idx_map, atol)]
+                    atol = [atol[idx] for idx in self._ori_remaining_idxs]
             kwargs['atol'] = atol
         return super(PartiallySolvedSystem, self).integrate(*args, **kwargs)
 
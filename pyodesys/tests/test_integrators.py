@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+from __future__ import (absolute_import, division, print_function)
+
+import numpy as np
+import pytest
+
+from .. import ODESys
+from .. import integrators
+from ..integrators import (
+    RK4_example_integrator, EulerForward_example_integrator, Midpoint_example_integrator,
+    EulerBackward_example_integrator, Trapezoidal_example_integrator
+)
+from ..symbolic import SymbolicSys
+from ..util import requires
+from .test_symbolic import decay_dydt_factory
+
+
+def _decay(t, y, p):
+    return [-p[0]*y[0], p[0]*y[0] - p[1]*y[1]]
+
+
+def _decay_jac(t, y, p):
+    return [[-p[0], 0],
+            [p[0], -p[1]]]
+
+
+def _decay_ref(t, y0, p):
+    y0_t = y0[0]*np.exp(-p[0]*t)
+    y1_t = y0[1]*np.exp(-p[1]*t) + y0[0]*p[0]/(p[1] - p[0])*(np.exp(-p[0]*t) - np.exp(-p[1]*t))
+    return np.array([y0_t, y1_t]).T
+
+
+@requires('scipy')
+@pytest.mark.parametrize('integrator, order', [
+    (RK4_example_integrator, 4),
+    (EulerForward_example_integrator, 1),
+    (Midpoint_example_integrator, 2),
+    (EulerBackward_example_integrator, 1),
+    (Trapezoidal_example_integrator, 2),
+])
+def test_example_integrators__predefined(integrator, order):
+    odesys = ODESys(_decay, _decay_jac)
+    y0, p = [3.0, 1.0], [2.0, 0.5]
+    errs = []
+    for n in (64, 128):
+        xout = np.linspace(0, 2, n+1)
+        yout, info = odesys.predefined(y0, xout, p, integrator=integrator)
+        assert yout.shape == (n+1, 2)
+        assert np.all(yout[0, :] == y0)
+        errs.append(np.max(np.abs(yout - _decay_ref(xout, y0, p))))
+    assert errs[1] < 1e-1
+    assert abs(np.log2(errs[0]/errs[1]) - order) < 0.3
+
+
+@requires('scipy')
+@pytest.mark.parametrize('integrator', [EulerBackward_example_integrator, Trapezoidal_example_integrator])
+def test_example_integrators__reuse_jacobian(integrator):
+    odesys = ODESys(_decay, _decay_jac)
+    y0, p = [3.0, 1.0], [2.0, 0.5]
+    xout = np.linspace(0, 2, 129)
+    yout, info = odesys.predefined(y0, xout, p, integrator=integrator)
+    assert info['njev'] == 1  # constant jacobian & step size
+
+    xout = np.concatenate((np.linspace(0, 1, 65), np.linspace(1, 2, 33)[1:]))
+    yout, info = odesys.predefined(y0, xout, p, integrator=integrator)
+    assert info['njev'] == 2  # step size doubles half way
+    assert np.allclose(yout, _decay_ref(xout, y0, p), atol=0.05)
+
+
+@pytest.mark.parametrize('integrator', [
+    RK4_example_integrator, EulerForward_example_integrator, Midpoint_example_integrator
+])
+def test_example_integrators__batch(integrator):
+    p = [2.0, 0.5]
+
+    def rhs(x, y, out):
+        out[..., 0] = -p[0]*y[..., 0]
+        out[..., 1] = p[0]*y[..., 0] - p[1]*y[..., 1]
+
+    y0 = np.array([[3.0, 1.0], [1.0, 0.0], [0.0, 2.0]])
+    xout = np.linspace(0, 2, 65)
+    yout, info = integrator.integrate_predefined(rhs, None, y0, xout)
+    assert yout.shape == (65, 3, 2)
+    for idx in range(3):
+        yref, _ = integrator.integrate_predefined(rhs, None, y0[idx], xout)
+        assert np.allclose(yout[:, idx, :], yref, rtol=1e-15, atol=1e-15)
+
+
+@requires('sym', 'scipy')
+@pytest.mark.parametrize('integrator', [EulerBackward_example_integrator, Trapezoidal_example_integrator])
+def test_example_integrators__banded_and_sparse(integrator):
+    k = (4, 3, 2)
+    y0 = (5, 4, 2, 1)
+    xout = np.linspace(0, 2, 65)
+    results = []
+    for kw in [{}, dict(band=(1, 0)), dict(sparse=True)]:
+        odesys = SymbolicSys.from_callback(decay_dydt_factory(k), len(k) + 1, **kw)
+        yout, info = odesys.predefined(y0, xout, integrator=integrator)
+        assert info['njev'] == 1
+        results.append(yout)
+    assert np.allclose(results[0], results[1], rtol=1e-12, atol=1e-12)
+    assert np.allclose(results[0], results[2], rtol=1e-12, atol=1e-12)
+
+
+@requires('numba', 'scipy')
+@pytest.mark.parametrize('integrator', [
+    RK4_example_integrator, EulerForward_example_integrator, Midpoint_example_integrator,
+    EulerBackward_example_integrator, Trapezoidal_example_integrator
+])
+def test_example_integrators__numba_vs_numpy(integrator, monkeypatch):
+    odesys = ODESys(_decay, _decay_jac)
+    y0, p = [3.0, 1.0], [2.0, 0.5]
+    xout = np.linspace(0, 2, 65)
+    yout_jit, _ = odesys.predefined(y0, xout, p, integrator=integrator)
+    for name in ('_rk4_combine_jit', '_newton_residual_jit', '_newton_update_jit'):
+        monkeypatch.setattr(integrators, name, None)
+    yout_np, _ = odesys.predefined(y0, xout, p, integrator=integrator)
+    assert np.allclose(yout_jit, yout_np, rtol=1e-14, atol=1e-14)
@@ -20,3 +20,44 @@ def test_plot_result_interpolation():
     odes.integrate([0, 1, 2], [1, 0], params=[2.0], nderiv=1,
                    integrator='cvode')
     odes.plot_result(interpolate=True)
+
+
+@requires('matplotlib')
+def test_info_vlines():
+    import numpy as np
+    import matplotlib.pyplot as plt
+    from ..plotting import info_vlines
+    xout = np.linspace(0, 1, 200)
+    fpes = {'FE_UNDERFLOW': 1, 'FE_OVERFLOW': 2}
+    info = {'fpes': np.tile([0, 1, 2, 3], 50)}
+    _fig, ax = plt.subplots(1, 1)
+    info_vlines(ax, xout, info, vline_keys=('steps', 'fe_underflow', 'fe_overflow'), fpes=fpes)
+    segments = [len(coll.get_segments()) for coll in ax.collections]
+    assert segments == [200, 100, 100]
+
+
+@requires('matplotlib', 'scipy')
+def test_plot_result__interpolate_from_derivatives():
+    import numpy as np
+    from scipy.interpolate import BPoly
+    from ..plotting import plot_result
+    x = np.linspace(1, 2, 5)
+    y = np.stack((np.exp(-x), -np.exp(-x)), axis=1)[..., None]*[1, 2, 3]  # (nx, nderiv+1, ny)
+    x_plot, y_plot = plot_result(x, y, interpolate=True)
+    assert y_plot.shape == (x_plot.size, 3)
+    for idx in range(3):
+        ref = BPoly.from_derivatives(x, y[..., idx])(x_plot)
+        assert np.allclose(y_plot[:, idx], ref, rtol=1e-14, atol=0)
+    assert np.allclose(y_plot, np.exp(-x_plot)[:, None]*[1, 2, 3], rtol=1e-4, atol=0)
+
+
+@requires('matplotlib')
+def test_plot_result__indices_iterator():
+    import numpy as np
+    import matplotlib.pyplot as plt
+    from ..plotting import plot_result
+    x = np.linspace(0, 1, 5)
+    y = np.random.random((5, 3))
+    _fig, ax = plt.subplots(1, 1)
+    plot_result(x, y, indices=(idx for idx in range(3)), ax=ax)
+    assert len(ax.get_lines()) == 3
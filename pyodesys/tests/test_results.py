@@ -2,10 +2,12 @@
 from __future__ import (absolute_import, division, print_function)
 
 import numpy as np
+import pytest
 
 from .. import ODESys
+from ..symbolic import SymbolicSys
 from ..util import requires
-from .test_core import sine, sine_jac
+from .test_core import sine, sine_jac, vdp_f, vdp_j
 
 
 def _test_sine(use_deriv, atol=1e-8, rtol=1e-8, forgive=1e4):
@@ -28,6 +30,19 @@ def _test_sine(use_deriv, atol=1e-8, rtol=1e-8, forgive=1e4):
     assert np.allclose(ref(probes), est2, atol=3e-2)
 
 
+@requires('scipy')
+def test_Result__unpacking():
+    result = ODESys(sine, sine_jac).integrate(np.linspace(0, 1, 5), [0, 6], [3])
+    xout, yout, info = result
+    assert xout is result.xout and yout is result.yout and info is result.info
+    assert result[0] is xout and result[1] is yout and result[2] is info
+    assert len(result) == 3
+    assert result[np.int64(1)] is yout
+    for key in (3, -1, True, slice(0, 2), 'xout'):
+        with pytest.raises(KeyError):
+            result[key]
+
+
 @requires('scipy')
 def test_Result_at():
     _test_sine(use_deriv=False)
@@ -50,3 +65,31 @@ def test_Result_extend_by_integration():
     assert result.info['success']
     ref = np.array([A*np.sin(k*result.xout), A*np.cos(k*result.xout)*k])
     assert np.allclose(ref.T, result.yout)
+
+
+@requires('sym', 'scipy')
+def test_Result_stiffness():
+    xout, y0, p = np.linspace(0, 2, 9), [1, 0], [2.0]
+    res_num = ODESys(vdp_f, vdp_j).integrate(xout, y0, p, integrator='scipy')
+    res_sym = SymbolicSys.from_callback(vdp_f, 2, 1).integrate(xout, y0, p, integrator='scipy')
+    ratio_num = res_num.stiffness()
+    ratio_sym = res_sym.stiffness()  # batched evaluation of the jacobian
+    assert ratio_num.shape == ratio_sym.shape == (9,)
+    assert np.all(ratio_num >= 1)
+    assert np.allclose(ratio_num, ratio_sym, rtol=1e-6)
+
+
+@requires('sym', 'scipy')
+def test_Result_stiffness__analytic():
+    def f(t, y, p):
+        return [-p[0]*y[0], p[0]*y[0] - p[1]*y[1]]
+
+    odesys = SymbolicSys.from_callback(f, 2, 2, backend='sympy')  # Matrix.eigenvals
+    res = odesys.integrate(np.linspace(0, 1, 5), [1, 0], [4.0, 1.0], integrator='scipy')
+    eigenvals_cb = odesys._get_analytic_stiffness_cb()
+    ratio = res.stiffness(eigenvals_cb=eigenvals_cb)  # evaluated for all points at once
+    x, y, p = res._internals()
+    ev = np.abs([eigenvals_cb(_x, _y, p) for _x, _y in zip(x, y)])
+    ratio_loop = ev.max(axis=-1)/ev.min(axis=-1)
+    assert np.allclose(ratio, 4.0)
+    assert np.allclose(ratio, ratio_loop)
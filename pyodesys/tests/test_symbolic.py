@@ -23,7 +23,7 @@ else:
     sym_backends = sym.Backend.backends.keys()
 
 from .. import ODESys
-from ..core import integrate_auto_switch, chained_parameter_variation
+from ..core import integrate_auto_switch, chained_parameter_variation, RecoverableError
 from ..symbolic import SymbolicSys, ScaledSys, symmetricsys, PartiallySolvedSystem, get_logexp, _group_invariants
 from ..util import requires, pycvodes_double, pycvodes_klu
 from .bateman import bateman_full  # analytic, never mind the details
@@ -140,6 +140,119 @@ def test_SymbolicSys__jacobian_singular():
     assert odesys.jacobian_singular()
 
 
+@requires('sym')
+def test_SymbolicSys__lambdify_kw():
+    def f(t, y, p, be):
+        return [p[0]*be.exp(y[0]*y[1]) - y[0], -p[0]*be.exp(y[0]*y[1])]
+
+    odesys_cse = SymbolicSys.from_callback(f, 2, 1)
+    assert odesys_cse.lambdify_kw == {'cse': True}
+    odesys_plain = SymbolicSys.from_callback(f, 2, 1, lambdify_kw={'cse': False})
+    y, p = [0.3, 0.7], [2.0]
+    assert np.allclose(odesys_cse.f_cb(0, y, p), odesys_plain.f_cb(0, y, p))
+    assert np.allclose(odesys_cse.j_cb(0, y, p), odesys_plain.j_cb(0, y, p))
+    assert SymbolicSys.from_other(odesys_plain).lambdify_kw == {'cse': False}
+
+
+@requires('sym')
+@pytest.mark.parametrize('band', [None, (1, 0)])
+def test_SymbolicSys__jac_and_dfdx(band):
+    def f(t, y, p, be):
+        return [p[0]*be.exp(-t*y[0]) - y[0], -p[0]*be.exp(-t*y[0])*t + y[0]]
+
+    odesys = SymbolicSys.from_callback(f, 2, 1, band=band)
+    x, y, p = 0.4, [0.3, 0.7], [2.0]
+    J, dfdx = odesys._jac_and_dfdx(x, y, p)  # one fused callback
+    assert np.allclose(J, odesys.j_cb(x, y, p))
+    assert np.allclose(dfdx, np.ravel(odesys.dfdx_cb(x, y, p)))
+    J_ref, dfdx_ref = ODESys._jac_and_dfdx(odesys, x, y, p)
+    assert np.allclose(J, J_ref) and np.allclose(dfdx, np.ravel(dfdx_ref))
+
+
+@requires('sym', 'numba')
+def test_SymbolicSys__lambdify_kw__use_numba():
+    odesys = SymbolicSys.from_callback(vdp_f, 2, 1, backend='sympy', lambdify_kw={'use_numba': True})
+    assert odesys.lambdify_kw == {'cse': True, 'use_numba': True}
+    ref = SymbolicSys.from_callback(vdp_f, 2, 1, backend='sympy')
+    y, p = [1.0, 0.5], [2.0]
+    assert np.allclose(odesys.f_cb(0, y, p), ref.f_cb(0, y, p))
+    assert np.allclose(odesys.j_cb(0, y, p), ref.j_cb(0, y, p))
+    xs, ys, ps = np.zeros(3), np.ones((3, 2)), np.ones((3, 1))
+    assert np.allclose(odesys.f_cb(xs, ys, ps), ref.f_cb(xs, ys, ps))
+
+
+@requires('sym', 'symengine')
+@pytest.mark.parametrize('lambdify_kw', [None, {'backend': 'llvm'}])
+def test_SymbolicSys__lambdify_kw__symengine(lambdify_kw):
+    odesys = SymbolicSys.from_callback(vdp_f, 2, 1, backend='symengine', lambdify_kw=lambdify_kw)
+    ref = SymbolicSys.from_callback(vdp_f, 2, 1, backend='sympy')
+    y, p = [1.0, 0.5], [2.0]
+    assert np.allclose(odesys.f_cb(0, y, p), ref.f_cb(0, y, p))
+    assert np.allclose(odesys.j_cb(0, y, p), ref.j_cb(0, y, p))
+    xout, yout, info = odesys.integrate(np.linspace(0, 1, 3), [1, 0], p, integrator='scipy')
+    xref, yref, info_ref = ref.integrate(np.linspace(0, 1, 3), [1, 0], p, integrator='scipy')
+    assert np.allclose(yout, yref)
+
+
+@requires('sym')
+@pytest.mark.parametrize('bounds', [dict(lower_bounds=[0, 0]), dict(upper_bounds=[1, 1]),
+                                    dict(lower_bounds=[0, 0], upper_bounds=[1, 1])])
+def test_SymbolicSys__bounds_wrapper(bounds):
+    odesys = SymbolicSys.from_callback(lambda x, y, p: [y[0], y[1]], 2, **bounds)
+    lb = np.array(bounds.get('lower_bounds', [-np.inf]*2))
+    ub = np.array(bounds.get('upper_bounds', [np.inf]*2))
+    odesys._current_integration_kwargs = dict(atol=1e-4)
+    assert np.allclose(odesys.f_cb(0, [0.5, 0.25]), [0.5, 0.25])
+    y = np.array([-5e-3, 1 + 5e-3])
+    assert np.allclose(odesys.f_cb(0, y/10), np.clip(y/10, lb, ub))  # within 10*atol: clipped
+    with pytest.raises(RecoverableError):
+        odesys.f_cb(0, y)
+    odesys._current_integration_kwargs = dict(atol=[1e-3, 1e-3])  # new integration, new tolerance
+    assert np.allclose(odesys.f_cb(0, y), np.clip(y, lb, ub))
+
+
+@requires('sym', 'symengine')
+def test_SymbolicSys__lambdify_kw__cachedir(tmpdir):
+    cachedir = str(tmpdir.join('cache'))
+    kw = dict(backend='symengine', lambdify_kw={'backend': 'llvm', 'cachedir': cachedir})
+    odesys = SymbolicSys.from_callback(vdp_f, 2, 1, **kw)
+    y, p = [1.0, 0.5], [2.0]
+    f_ref, j_ref = odesys.f_cb(0, y, p), odesys.j_cb(0, y, p)
+    nfiles = len(tmpdir.join('cache').listdir())
+    assert nfiles >= 2
+    cached = SymbolicSys.from_callback(vdp_f, 2, 1, **kw)
+    assert np.allclose(cached.f_cb(0, y, p), f_ref)
+    assert np.allclose(cached.j_cb(0, y, p), j_ref)
+    assert len(tmpdir.join('cache').listdir()) == nfiles
+
+
+@requires('sym', 'symengine')
+def test_SymbolicSys__lambdify_kw__cachedir__exact_key(tmpdir):
+    kw = dict(backend='symengine', lambdify_kw={'backend': 'llvm', 'cachedir': str(tmpdir)})
+    coeffs = 0.12345678901234566, 0.12345678901234568, 0.123456789012346  # equal when printed
+    results = [SymbolicSys.from_callback(lambda x, y, p: [-c*y[0]], 1, **kw).f_cb(0, [1.0])[0]
+               for c in coeffs]
+    assert results == [-c for c in coeffs]
+
+
+@requires('sym')
+def test_SymbolicSys__lambdify_kw__cachedir__unpicklable(tmpdir):
+    kw = dict(backend='sympy', lambdify_kw={'cachedir': str(tmpdir)})
+    for _ in range(2):
+        odesys = SymbolicSys.from_callback(vdp_f, 2, 1, **kw)
+        assert np.allclose(odesys.f_cb(0, [1.0, 0.5], [2.0]), [0.5, -1.0])
+    assert tmpdir.listdir() == []
+
+
+@requires('sym', 'symengine')
+def test_SymbolicSys__lambdify_kw__cachedir__unwritable(tmpdir):
+    tmpdir.join('not_a_dir').write('')
+    cachedir = str(tmpdir.join('not_a_dir').join('cache'))  # os.makedirs fails
+    kw = dict(backend='symengine', lambdify_kw={'backend': 'llvm', 'cachedir': cachedir})
+    odesys = SymbolicSys.from_callback(vdp_f, 2, 1, **kw)
+    assert np.allclose(odesys.f_cb(0, [1.0, 0.5], [2.0]), [0.5, -1.0])
+
+
 @requires('sym', 'pycvodes')
 @pycvodes_klu
 def test_SymbolicSys_jacobian_sparse():
@@ -636,6 +749,38 @@ def test_PartiallySolvedSystem(integrator):
     assert np.allclose(yout, ref)
 
 
+@requires('sym', 'scipy')
+def test_PartiallySolvedSystem__atol_per_component():
+    odesys = _get_decay3(lower_bounds=[0, 0, 0])
+    partsys = PartiallySolvedSystem(odesys, lambda x0, y0, p0, be: {
+        odesys.dep[1]: y0[0]*p0[0]/(p0[1] - p0[0])*(be.exp(-p0[0]*(odesys.indep-x0)) -
+                                                    be.exp(-p0[1]*(odesys.indep-x0))) +
+        y0[1]*be.exp(-p0[1]*(odesys.indep-x0))
+    })
+    assert list(partsys.lower_bounds) == [0, 0]
+    y0 = [3, 2, 1]
+    k = [3.5, 2.5, 1.5]
+    xout, yout, info = partsys.integrate(np.linspace(0, 1, 5), y0, k, integrator='scipy',
+                                         atol=[1e-10, 1e-3, 1e-10], rtol=1e-10)
+    ref = np.array(bateman_full(y0, k, xout - xout[0], exp=np.exp)).T
+    assert np.allclose(yout, ref, rtol=1e-8, atol=1e-8)
+
+
+@requires('sym', 'scipy')
+def test_PartiallySolvedSystem_ScaledSys__multi():
+    odesys = ScaledSys.from_other(_get_decay3(), dep_scaling=1e3)
+    partsys = PartiallySolvedSystem(odesys, lambda x0, y0, p0, be: {
+        odesys.dep[0]: y0[0]*be.exp(-p0[0]*(odesys.indep-x0))
+    })
+    xout = np.array([np.linspace(0, 1, 5), np.linspace(0, 2, 5)])
+    y0 = np.array([[3, 2, 1], [1, 0, 0]])
+    k = np.array([[3.5, 2.5, 1.5], [2.0, 1.0, 0.5]])
+    results = partsys.integrate(xout, y0, k, integrator='scipy', atol=1e-10, rtol=1e-10)
+    for idx, res in enumerate(results):
+        ref = np.array(bateman_full(y0[idx], k[idx], res.xout - res.xout[0], exp=np.exp)).T
+        assert np.allclose(res.yout, ref, rtol=1e-7, atol=1e-7)
+
+
 @requires('sym', 'pycvodes')
 def test_PartiallySolvedSystem_ScaledSys():
     odesys = _get_decay3(lower_bounds=[0, 0, 0])
@@ -1,9 +1,10 @@
 from __future__ import absolute_import
 
+import numpy as np
 import pytest
 
 from ..symbolic import SymbolicSys
-from ..util import requires, import_
+from ..util import requires, import_, _Callback
 from .test_symbolic import decay_dydt_factory
 
 
@@ -34,3 +35,31 @@ def test_import_():
     qux = import_('qux')
     with pytest.raises(ImportError):
         qux.__name__
+
+
+@requires('sym')
+def test_Callback__autonomous_without_params():
+    from sym import Backend
+    be = Backend('sympy')
+    y0, y1 = be.symbols('y0 y1')
+    cb = _Callback(None, (y0, y1), (), [y0*y1, y0 - y1], Lambdify=be.Lambdify)
+    assert np.allclose(cb(0, [2, 3]), [6, -1])
+    assert np.allclose(cb(np.zeros(2), np.array([[2., 3.], [1., 1.]])), [[6, -1], [1, 0]])
+    assert np.allclose(cb(np.zeros(2), [2, 3]), [[6, -1], [6, -1]])  # broadcast against x
+    with pytest.raises(TypeError):
+        cb(0, [1, 2, 3])
+
+
+@requires('sym')
+def test_Callback__Lambdify_without_kwargs():
+    from sym import Backend
+    be = Backend('sympy')
+
+    def Lambdify(args, exprs):  # e.g. pysym & symcxx take no keyword arguments
+        return be.Lambdify(args, exprs)
+
+    y0, y1 = be.symbols('y0 y1')
+    cb = _Callback(None, (y0, y1), (), [y0*y1], Lambdify=Lambdify, lambdify_kw=dict(cse=True))
+    assert np.allclose(cb(0, [2, 3]), [6])
+    with pytest.raises(TypeError):
+        _Callback(None, (y0, y1), (), [y0*y1], Lambdify=Lambdify, lambdify_kw=dict(use_numba=True))
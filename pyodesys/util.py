@@ -2,10 +2,14 @@
 from __future__ import (absolute_import, division, print_function)
 
 from functools import reduce
+import hashlib
 import inspect
 import math
 import operator
+import os
+import pickle
 import sys
+import tempfile
 
 from pkg_resources import parse_requirements, parse_version
 
@@ -79,8 +83,8 @@ def transform_exprs_dep(fw, bw, dep_exprs, check=True):
     dep, exprs = zip(*dep_exprs)
     if check:
         check_transforms(fw, bw, dep)
-    bw_subs = list(zip(dep, bw))
-    return [(e*f.diff(y)).subs(bw_subs) for f, y, e in zip(fw, dep, exprs)]
+    bw_subs = dict(zip(dep, bw))
+    return [(e*f.diff(y)).xreplace(bw_subs) for f, y, e in zip(fw, dep, exprs)]
 
 
 def transform_exprs_indep(fw, bw, dep_exprs, indep, check=True):
@@ -110,7 +114,8 @@ def transform_exprs_indep(fw, bw, dep_exprs, indep, check=True):
             fmtstr = 'Incorrect (did you set real=True?) bw: %s'
             raise ValueError(fmtstr % str(bw))
     dep, exprs = zip(*dep_exprs)
-    return [(e/fw.diff(indep)).subs(indep, bw) for e in exprs]
+    bw_subs = {indep: bw}
+    return [(e/fw.diff(indep)).xreplace(bw_subs) for e in exprs]
 
 
 class _Blessed(object):
@@ -158,36 +163,99 @@ def _concat(*args):
     return np.concatenate(list(map(np.atleast_1d, args)))
 
 
+def _callback_args(indep, dep, params):
+    """ Arguments of the generated callbacks: ``[indep,] *dep, *params`` """
+    return _concat(dep, params) if indep is None else _concat(indep, dep, params)
+
+
+def _cached_lambdify(cachedir, Lambdify, args, exprs, **kwargs):
+    """ Calls ``Lambdify`` unless a pickled callback for the same input is found in ``cachedir``
+
+    The file name is the SHA1 hexdigest of the (exact) ``srepr`` of the arguments and expressions
+    (and the version of the module providing ``Lambdify``). This is mainly useful with
+    ``symengine.Lambdify(..., backend='llvm')`` whose pickled callbacks contain the generated machine
+    code, i.e. the JIT compilation of a large system is only done once. Callbacks which cannot be
+    pickled (or written to ``cachedir``) are returned uncached. Note that the cache is read using ``pickle``: only use
+    directories which are trusted.
+    """
+    from sympy import srepr, sympify
+    mod = Lambdify.__module__
+    version = getattr(sys.modules.get(mod.split('.')[0]), '__version__', None)
+    key = hashlib.sha1(repr((
+        mod, Lambdify.__name__, version, srepr([sympify(arg) for arg in args]),
+        getattr(exprs, 'shape', None), srepr([sympify(expr) for expr in exprs]), sorted(kwargs.items())
+    )).encode('utf-8')).hexdigest()
+    path = os.path.join(cachedir, key + '.pkl')
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as ifh:
+                return pickle.load(ifh)
+        except Exception:
+            pass  # e.g. a corrupt file, treated as a cache miss (and overwritten below)
+    cb = Lambdify(args, exprs, **kwargs)
+    tmp_path = None
+    try:
+        if not os.path.exists(cachedir):
+            os.makedirs(cachedir)
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=cachedir)
+        with os.fdopen(fd, 'wb') as ofh:
+            pickle.dump(cb, ofh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)  # atomic, never leaves a partially written file at ``path``
+    except Exception:  # the cache is optional: e.g. unpicklable callback or unwritable cachedir
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return cb
+
+
 class _Callback(_Blessed):
 
-    def __init__(self, indep, dep, params, exprs, Lambdify=None):
+    def __init__(self, indep, dep, params, exprs, Lambdify=None, lambdify_kw=None, args=None):
         self.indep, self.dep, self.params = indep, dep, params
-        if indep is None:
-            self.args = _concat(self.dep, self.params)
-        else:
-            self.args = _concat(self.indep, self.dep, self.params)
+        # ``args`` may be passed when several callbacks share the same (precomputed) arguments
+        self.args = _callback_args(indep, dep, params) if args is None else args
         self.input_width = len(self.args)
         self.exprs = exprs
-        self.callback = Lambdify(self.args, self.exprs)
+        lambdify_kw = dict(lambdify_kw or {})
+        cachedir = lambdify_kw.pop('cachedir', None)
+        try:
+            self.callback = self._lambdify(Lambdify, cachedir, **lambdify_kw)
+        except TypeError:
+            if 'cse' not in lambdify_kw:
+                raise
+            # cse is only an optimization, some backends (e.g. pysym & symcxx) take no keyword arguments:
+            lambdify_kw.pop('cse')
+            self.callback = self._lambdify(Lambdify, cachedir, **lambdify_kw)
         self.ny = len(dep)
         self.take_params = len(params)
+        # argument layout is fixed: [x,] y, params
+        self._nx = 0 if indep is None else 1
+        self._y_slice = slice(self._nx, self._nx + self.ny)
+        self._p_slice = slice(self._nx + self.ny, None)
+        self._inp = np.empty(self.input_width)  # reused between calls with the same shape of x
+        self._y_only = self.input_width == self.ny  # autonomous & without parameters
+
+    def _lambdify(self, Lambdify, cachedir, **kwargs):
+        if cachedir is None:
+            return Lambdify(self.args, self.exprs, **kwargs)
+        else:
+            return _cached_lambdify(cachedir, Lambdify, self.args, self.exprs, **kwargs)
 
     def __call__(self, x, y, params=(), backend=None):
         _x = np.asarray(x)
         _y = np.asarray(y)
-        _p = np.asarray(params)[..., :self.take_params]
         if _y.shape[-1] != self.ny:
             raise TypeError("Incorrect shape of y")
-        inp = np.empty(_x.shape + (self.input_width,))
-        if self.indep is None:
-            nx = 0
-        else:
-            inp[..., 0] = _x = np.asarray(x)
-            nx = 1
-        inp[..., nx:(nx+self.ny)] = _y
-        inp[..., (nx+self.ny):] = _p
-        result = self.callback(inp)
-        return result
+        if self._y_only and _y.shape[:-1] == _x.shape:
+            return self.callback(np.ascontiguousarray(_y, dtype=np.float64))  # no need to copy into _inp
+        _p = np.asarray(params)[..., :self.take_params]
+        if self._inp.shape[:-1] != _x.shape:
+            self._inp = np.empty(_x.shape + (self.input_width,))
+        inp = self._inp
+        if self._nx:
+            inp[..., 0] = _x
+        inp[..., self._y_slice] = _y
+        inp[..., self._p_slice] = _p
+        return self.callback(inp)
 
 
 class requires(object):